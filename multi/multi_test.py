@@ -1,15 +1,16 @@
 from multiprocessing import Pool, Process
 
+N_WORKERS = 4
+
 def foo(x):
     """
-    Simple function to return the factorial of an integer
+    Return the sum of squares below x * 10, so that each task carries
+    enough work to amortise the cost of sending it to a worker
     """
-    if x == 0:
-        return 1
-    else:
-        return x * x
+    return sum(i * i for i in range(x * 10))
 
 if __name__ == "__main__":
 	test = [x for x in range(1000)]
-	with Pool(4) as p:
-		p.map(foo, test, chunksize=50)
+	chunksize = max(1, len(test) // (N_WORKERS * 4))
+	with Pool(N_WORKERS) as p:
+		p.map(foo, test, chunksize=chunksize)
@@ -1,11 +1,9 @@
 def foo(x):
     """
-    Simple function to return the factorial of an integer
+    Return the sum of squares below x * 10, the same workload that
+    multi_test.py distributes over a Pool
     """
-    if x == 0:
-        return 1
-    else:
-        return x * x
+    return sum(i * i for i in range(x * 10))
 
 if __name__ == "__main__":
     test = [x for x in range(1000)]